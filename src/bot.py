@@ -4,6 +4,7 @@ runs the client.
 """
 
 from client import WordBearerClient
+from dataclasses import dataclass
 from dotenv import load_dotenv
 import os
 import logging
@@ -23,6 +24,9 @@ class LoguruHandler(logging.Handler):
     """
 
     def emit(self, record: logging.LogRecord):
+        # Skip the frame walk for records no loguru sink will accept
+        if record.levelno < logger._core.min_level:
+            return
         try:
             level = logger.level(record.levelname).name
         except ValueError:
@@ -56,20 +60,50 @@ def safe_env(key: str) -> str:
     return value
 
 
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """
+    Configuration for the bot, read once from
+    the environment at startup.
+    """
+
+    job_dir: str
+    finished_job_dir: str
+    league_dir: str
+    bot_token: str
+    log_file: str
+
+    @classmethod
+    def from_env(cls) -> "BotConfig":
+        """Builds the configuration from the environment.
+
+        Raises:
+            RuntimeError: If a required key is not present
+
+        Returns:
+            BotConfig: The loaded configuration
+        """
+        return cls(
+            job_dir=safe_env(JOB_DIR),
+            finished_job_dir=safe_env(FINISHED_JOB_DIR),
+            league_dir=safe_env(LEAGUE_DIR),
+            bot_token=safe_env(BOT_TOKEN),
+            log_file=safe_env(LOG_FILE),
+        )
+
+
 def main():
     """
     Retrieves configuration from environment and
     runs the bot.
     """
     load_dotenv()
-    job_dir = safe_env(JOB_DIR)
-    finished_job_dir = safe_env(FINISHED_JOB_DIR)
-    league_dir = safe_env(LEAGUE_DIR)
-    bot_token = safe_env(BOT_TOKEN)
-    log_file = safe_env(LOG_FILE)
-    logger.add(log_file)
-    discord_client = WordBearerClient(job_dir, finished_job_dir, league_dir)
-    discord_client.run(bot_token, log_handler=LoguruHandler())
+    config = BotConfig.from_env()
+    logger.add(config.log_file)
+    discord_client = WordBearerClient(
+        config.job_dir, config.finished_job_dir, config.league_dir
+    )
+    discord_client.run(config.bot_token, log_handler=LoguruHandler())
 
 
 if __name__ == "__main__":
@@ -13,9 +13,13 @@ from ladder.ladder import LadderConfig, LadderPeriod
 from loguru import logger
 from zoneinfo import ZoneInfo
 from typing import Callable
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from pathlib import Path
-import json
+import os
+import time
+
+UTC = ZoneInfo("UTC")
+EASTERN = ZoneInfo("America/New_York")
 
 
 def adapt_submission(submission: MatchSubmission) -> DiscordLadderResult:
@@ -45,6 +49,8 @@ class LeagueConfig(BaseModel):
     are retrieved from json files.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     start_date: datetime
     end_date: datetime
     league_name: str
@@ -60,8 +66,9 @@ class WordBearerClient(discord.Client):
 
     user: discord.ClientUser
     message_handler: MessageJobHandler
-    leagues: dict[str, LadderManager] = {}
+    leagues: dict[str, LadderManager]
     league_dir: str
+    _league_files: dict[str, tuple[int, str | None]]
 
     def __init__(
         self,
@@ -78,19 +85,42 @@ class WordBearerClient(discord.Client):
         self.tree = app_commands.CommandTree(self)
         self.message_handler = MessageJobHandler(job_dir, finished_job_dir, self)
         self.league_dir = league_dir
+        self.leagues = {}
+        self._league_files = {}
 
     def _setup_leagues(self):
         """
         Reads json files from the league directory and creates
         LadderManager instances from them. Currently periods are
-        fixed to weekly.
+        fixed to weekly. Files that haven't changed since the last
+        call keep their existing manager, and leagues whose file has
+        been removed are dropped. Files that aren't valid leagues
+        are logged and skipped until they change.
         """
-        for file in Path(self.league_dir).glob("*.json"):
-            with file.open() as f:
-                league_config = LeagueConfig.model_validate(json.load(f))
+        league_files: dict[str, tuple[int, str | None]] = {}
+        results_dir = str(Path(self.league_dir, "results"))
+        config_dir = str(Path(self.league_dir, "messages"))
+        with os.scandir(self.league_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                known = self._league_files.get(entry.path)
+                if known is not None and known[0] == mtime:
+                    league_files[entry.path] = known
+                    continue
+
+                try:
+                    with open(entry.path, "rb") as f:
+                        league_config = LeagueConfig.model_validate_json(f.read())
+                    posting_day = IsoWeekday(league_config.posting_day)
+                except ValueError as e:
+                    logger.error("Skipping invalid league file {}: {}", entry.path, e)
+                    league_files[entry.path] = (mtime, None)
+                    continue
                 ladder_config = LadderConfig(
-                    start_date=league_config.start_date.astimezone(tz=ZoneInfo("UTC")),
-                    end_date=league_config.end_date.astimezone(tz=ZoneInfo("UTC")),
+                    start_date=league_config.start_date.astimezone(tz=UTC),
+                    end_date=league_config.end_date.astimezone(tz=UTC),
                     period=LadderPeriod.WEEKLY,
                     games_per_period=1,
                 )
@@ -98,13 +128,23 @@ class WordBearerClient(discord.Client):
                     self,
                     ladder_config,
                     league_config.channel_id,
-                    results_dir=str(Path(self.league_dir, "results")),
+                    results_dir=results_dir,
                     league_name=league_config.league_name,
-                    config_dir=str(Path(self.league_dir, "messages")),
-                    posting_day=IsoWeekday(league_config.posting_day),
+                    config_dir=config_dir,
+                    posting_day=posting_day,
                     posting_enabled=league_config.posting_enabled,
                 )
+                replaced = self.leagues.get(manager.league_name)
+                if replaced is not None:
+                    replaced.close()
                 self.leagues[manager.league_name] = manager
+                league_files[entry.path] = (mtime, manager.league_name)
+
+        active_names = {name for _, name in league_files.values()}
+        for _, name in self._league_files.values():
+            if name not in active_names and name in self.leagues:
+                self.leagues.pop(name).close()
+        self._league_files = league_files
 
     def write_ladder_result(self, result: DiscordLadderResult) -> None:
         """Writes a ladder result to storage.
@@ -115,13 +155,22 @@ class WordBearerClient(discord.Client):
         if result.league_name in self.leagues:
             self.leagues[result.league_name].store_result(result)
         else:
-            logger.warning(f"An orphaned result was submitted: {result}")
+            logger.warning("An orphaned result was submitted: {}", result)
+
+    async def close(self) -> None:
+        """
+        Closes the league result files before shutting
+        down the client.
+        """
+        for league in self.leagues.values():
+            league.close()
+        await super().close()
 
     async def on_ready(self):
         """
         Logs when bot is ready to begin.
         """
-        logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
+        logger.info("Logged in as {} (ID: {})", self.user, self.user.id)
 
     async def setup_hook(self) -> None:
         """
@@ -162,8 +211,8 @@ class MatchCommands(app_commands.Group):
     that can be attached to a discord client.
     """
 
-    managers: list[LadderManager] = []
     submission_callback: Callable[[MatchSubmission], None]
+    _active_cache: tuple[int, list[str]]
 
     def __init__(
         self,
@@ -173,21 +222,27 @@ class MatchCommands(app_commands.Group):
         super().__init__(name="match")
         self.client = client
         self.submission_callback = callback
+        self._active_cache = (-1, [])
 
     def _active_leagues(self):
         """
         Checks league names that are currently running. If none
         are active, returns a dummy entry because the modal requires
-        this as a field.
+        this as a field. The result is reused for the rest of the
+        current minute.
         """
+        minute = int(time.time()) // 60
+        if minute == self._active_cache[0]:
+            return self._active_cache[1]
         leagues = []
-        now = datetime.now(tz=ZoneInfo("America/New_York"))
+        now = datetime.now(tz=EASTERN)
         for manager in self.client.leagues.values():
-            logger.debug(f"Checking if {now} >= {manager.config.start_date}")
+            logger.debug("Checking if {} >= {}", now, manager.config.start_date)
             if now >= manager.config.start_date and now <= manager.config.end_date:
                 leagues.append(manager.league_name)
         if len(leagues) == 0:
             leagues.append("No active leagues available")
+        self._active_cache = (minute, leagues)
         return leagues
 
     @app_commands.command(name="report", description="Submit match")
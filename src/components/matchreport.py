@@ -7,8 +7,7 @@ import discord.ui as ui
 import traceback
 from pydantic import BaseModel, Field
 from typing import Callable
-from datetime import datetime
-from zoneinfo import ZoneInfo
+import time
 from loguru import logger
 
 
@@ -100,13 +99,13 @@ class MatchReport(discord.ui.Modal, title="Match Report"):
             player_won=player_won,
             was_draw=draw,
             notes=feedback,
-            timestamp=int(datetime.now(tz=ZoneInfo("UTC")).timestamp()),
+            timestamp=int(time.time()),
         )
         return result
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
         result = self._create_result(interaction)
-        logger.info(f"Result submitted: {result}")
+        logger.info("Result submitted: {}", result)
         self.submission_callback(result)
         await interaction.response.send_message(
             "Your match results have been submitted!", ephemeral=True
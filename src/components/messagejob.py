@@ -2,29 +2,42 @@
 Holds the component which handles scheduled messaging.
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime
-import json
+import heapq
 from pathlib import Path
 import os
 from loguru import logger
 from zoneinfo import ZoneInfo
 import discord
+from pydantic import AwareDatetime, ConfigDict, TypeAdapter, ValidationError
 import shutil
 
+UTC = ZoneInfo("UTC")
+MAX_CONCURRENT_SENDS = 5
+MAX_SEND_ATTEMPTS = 5
+
 
 @dataclass
 class MessageJob:
     """
     Holds configuration for a scheduled
-    message job.
+    message job. Timestamps in job files are
+    unix epoch seconds, or ISO timestamps with
+    a timezone.
     """
 
+    __pydantic_config__ = ConfigDict(coerce_numbers_to_str=True)
+
     id: str
-    timestamp: datetime
+    timestamp: AwareDatetime
     channel_id: int
     content: str
-    files: list[str]
+    files: list[str] = field(default_factory=list)
+
+
+MESSAGE_JOB_ADAPTER = TypeAdapter(MessageJob)
 
 
 class MessageJobHandler:
@@ -35,9 +48,14 @@ class MessageJobHandler:
 
     job_dir: str = "/jobs"
     finished_dir: str = "/jobs/finished"
-    jobs: dict[str, MessageJob] = {}
+    jobs: dict[str, MessageJob]
     client: discord.Client
     debug: bool
+    _job_files: dict[str, tuple[int, MessageJob | None]]
+    _due_heap: list[tuple[datetime, str]]
+    _sent_ids: set[str]
+    _failed_ids: set[str]
+    _send_attempts: dict[str, int]
 
     def __init__(self, job_dir: str, finished_dir: str, client: discord.Client):
         """Initializes the class
@@ -50,6 +68,12 @@ class MessageJobHandler:
         self.job_dir = job_dir
         self.finished_dir = finished_dir
         self.client = client
+        self.jobs = {}
+        self._job_files = {}
+        self._due_heap = []
+        self._sent_ids = set()
+        self._failed_ids = set()
+        self._send_attempts = {}
         self._ensure_dirs()
 
     def _ensure_dirs(self):
@@ -59,6 +83,19 @@ class MessageJobHandler:
         for dir in [self.job_dir, self.finished_dir]:
             Path(dir).mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _open_files(paths: list[str]) -> list[discord.File]:
+        """Opens attachments for a job. This does blocking
+        file I/O, so it is run in a worker thread.
+
+        Args:
+            paths (list[str]): The attachment paths
+
+        Returns:
+            list[discord.File]: The opened attachments
+        """
+        return [discord.File(path) for path in paths]
+
     async def _run_job(self, job: MessageJob):
         """Runs a job, sending the message. Does not do
         time/resend validation.
@@ -70,7 +107,7 @@ class MessageJobHandler:
             RuntimeError: If the channel for the job isn't valid
         """
         logger.info(
-            f"Running MessageJob with id {job.id} and timestamp {job.timestamp}"
+            "Running MessageJob with id {} and timestamp {}", job.id, job.timestamp
         )
         channel = self.client.get_channel(job.channel_id)
         if not channel:
@@ -80,7 +117,9 @@ class MessageJobHandler:
             or isinstance(channel, discord.Thread)
         ):
             raise RuntimeError(f"Job requested invalid channel: {job}")
-        files = [discord.File(path) for path in job.files]
+        files = []
+        if job.files:
+            files = await asyncio.to_thread(self._open_files, job.files)
 
         await channel.send(
             content=job.content,
@@ -90,7 +129,23 @@ class MessageJobHandler:
             ),
         )
 
-    def _mark_done(self, job: MessageJob):
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """Checks whether a failed send might succeed if it is
+        tried again, e.g. a Discord server error or a dropped
+        connection.
+
+        Args:
+            error (Exception): The error the send raised
+
+        Returns:
+            bool: True if the send should be retried
+        """
+        if isinstance(error, discord.HTTPException):
+            return error.status >= 500 or error.status == 429
+        return isinstance(error, (ConnectionError, TimeoutError))
+
+    async def _mark_done(self, job: MessageJob):
         """Moves a job from the queue to the finished
         directory so it won't be picked up on future restarts.
 
@@ -100,40 +155,111 @@ class MessageJobHandler:
         job_path = f"{self.job_dir}/{job.id}.json"
         self.jobs.pop(job.id, None)
         if os.path.exists(job_path):
-            shutil.move(job_path, f"{self.finished_dir}/{job.id}.json")
+            await asyncio.to_thread(
+                shutil.move, job_path, f"{self.finished_dir}/{job.id}.json"
+            )
 
     def load_jobs(self):
         """
-        Loads jobs from the queue directory
+        Loads jobs from the queue directory. Files that haven't
+        changed since the last load are not parsed again, and newly
+        parsed jobs are scheduled on the due heap. Files that
+        aren't valid jobs are logged and skipped until they change.
         """
-        jobs = {}
-
-        for file in Path(self.job_dir).glob("*.json"):
-            with file.open() as f:
-                raw = json.load(f)
-
-            job = MessageJob(
-                id=raw["id"],
-                timestamp=datetime.fromtimestamp(
-                    int(raw["timestamp"]), tz=ZoneInfo("UTC")
-                ),
-                channel_id=int(raw["channel_id"]),
-                content=raw["content"],
-                files=raw.get("files", []),
-            )
+        job_files: dict[str, tuple[int, MessageJob | None]] = {}
+
+        with os.scandir(self.job_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                known = self._job_files.get(entry.path)
+                if known is not None and known[0] == mtime:
+                    job_files[entry.path] = known
+                    continue
+
+                with open(entry.path, "rb") as f:
+                    try:
+                        job = MESSAGE_JOB_ADAPTER.validate_json(f.read())
+                    except ValidationError as e:
+                        logger.error("Skipping invalid job file {}: {}", entry.path, e)
+                        job_files[entry.path] = (mtime, None)
+                        continue
+                job_files[entry.path] = (mtime, job)
+                heapq.heappush(self._due_heap, (job.timestamp, job.id))
+                self._failed_ids.discard(job.id)
+                self._send_attempts.pop(job.id, None)
 
-            jobs[job.id] = job
-        logger.info(f"{len(jobs)} jobs loaded")
-        self.jobs = jobs
+        self._job_files = job_files
+        self.jobs = {job.id: job for _, job in job_files.values() if job is not None}
+        logger.info("{} jobs loaded", len(self.jobs))
 
     async def run_jobs(self):
         """
         Check if messages are due to be sent. For any that are,
-        send them and then archive them.
+        send them and then archive them. Due jobs are sent concurrently,
+        up to MAX_CONCURRENT_SENDS at a time. A job whose send fails
+        with an error that might not happen again is pushed back onto
+        the heap and retried on the next run, up to MAX_SEND_ATTEMPTS
+        times. Any other failed job is logged and not tried again until
+        its file changes. A job that was sent but couldn't be archived
+        is logged and remembered as sent, so it is never sent twice.
+
+        Heap entries for jobs that were removed or rescheduled since
+        they were pushed are skipped when they come due.
         """
-        now = datetime.now(ZoneInfo("UTC"))
-        due = [job for job in self.jobs.values() if job.timestamp <= now]
+        now = datetime.now(UTC)
+        due: dict[str, MessageJob] = {}
+        while self._due_heap and self._due_heap[0][0] <= now:
+            timestamp, job_id = heapq.heappop(self._due_heap)
+            job = self.jobs.get(job_id)
+            if (
+                job is not None
+                and job.timestamp == timestamp
+                and job_id not in self._sent_ids
+                and job_id not in self._failed_ids
+            ):
+                due[job_id] = job
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
+        async def send(job: MessageJob):
+            async with semaphore:
+                await self._run_job(job)
 
-        for job in due:
-            await self._run_job(job)
-            self._mark_done(job)
+        results = await asyncio.gather(
+            *(send(job) for job in due.values()), return_exceptions=True
+        )
+        sent: list[MessageJob] = []
+        for job, result in zip(due.values(), results):
+            if not isinstance(result, Exception):
+                self._send_attempts.pop(job.id, None)
+                sent.append(job)
+                continue
+            attempts = self._send_attempts.get(job.id, 0) + 1
+            if self._is_transient(result) and attempts < MAX_SEND_ATTEMPTS:
+                logger.warning(
+                    "MessageJob {} failed on attempt {}, retrying: {!r}",
+                    job.id,
+                    attempts,
+                    result,
+                )
+                self._send_attempts[job.id] = attempts
+                heapq.heappush(self._due_heap, (job.timestamp, job.id))
+            else:
+                logger.opt(exception=result).error(
+                    "MessageJob {} failed after {} attempts, giving up",
+                    job.id,
+                    attempts,
+                )
+                self._send_attempts.pop(job.id, None)
+                self._failed_ids.add(job.id)
+
+        results = await asyncio.gather(
+            *(self._mark_done(job) for job in sent), return_exceptions=True
+        )
+        for job, result in zip(sent, results):
+            if isinstance(result, Exception):
+                logger.opt(exception=result).error(
+                    "MessageJob {} was sent but could not be archived", job.id
+                )
+                self._sent_ids.add(job.id)
@@ -4,10 +4,8 @@ Holds abstract ladder league logic.
 
 from dataclasses import dataclass
 from enum import IntEnum
-import math
-from datetime import datetime
-from typing import Callable, Sequence
-from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
 
 INITIAL_POINTS = 10
 
@@ -34,39 +32,20 @@ class LadderConfig:
     games_per_period: int
 
 
-class LadderResult(ABC):
+@dataclass(frozen=True, slots=True)
+class LadderResult:
     """
-    An interface for objects that store
-    the results of a Ladder League match.
+    Stores the result of a Ladder League match,
+    from the perspective of the submitting player.
     """
 
-    @abstractmethod
-    def player_name(self) -> str:
-        pass
-
-    @abstractmethod
-    def opponent_name(self) -> str:
-        pass
-
-    @abstractmethod
-    def player_won(self) -> bool:
-        pass
-
-    @abstractmethod
-    def player_vp(self) -> int:
-        pass
-
-    @abstractmethod
-    def opponent_vp(self) -> int:
-        pass
-
-    @abstractmethod
-    def was_draw(self) -> bool:
-        pass
-
-    @abstractmethod
-    def match_date(self) -> datetime:
-        pass
+    player_name: str
+    opponent_name: str
+    player_won: bool
+    player_vp: int
+    opponent_vp: int
+    was_draw: bool
+    match_date: datetime
 
 
 @dataclass
@@ -80,10 +59,10 @@ class LadderPlayer:
     games_played: int
     games_won: int
     games_drawn: int
-    opponents_played: list[str]
+    opponents_played: set[str]
     total_vp: int
     ladder_points: int
-    match_periods: dict[int, int]
+    played_periods: int
 
     def __init__(self, name: str, initial_points: int):
         self.ladder_points = initial_points
@@ -91,24 +70,19 @@ class LadderPlayer:
         self.games_played = 0
         self.games_won = 0
         self.games_drawn = 0
-        self.opponents_played = []
+        self.opponents_played = set()
         self.total_vp = 0
-        self.match_periods = {}
+        # Bitset with bit n set once a game has been played in period n
+        self.played_periods = 0
 
 
-def period_of_date(d: datetime, c: LadderConfig):
+def period_of_date(d: datetime, c: LadderConfig) -> int:
     """
     Determines the numeric period (0+) of a date given
-    the configuration for the league
+    the configuration for the league. Dates before the
+    start of the league fall into the first period.
     """
-    result_diff = d - c.start_date
-    if c.period == LadderPeriod.WEEKLY:
-        period = result_diff.days % 7
-        return period
-    else:
-        raise RuntimeError(
-            f"Period determination not implemented for {LadderConfig.period}"
-        )
+    return max((d - c.start_date) // timedelta(days=c.period), 0)
 
 
 def update_players_basic(
@@ -124,26 +98,29 @@ def update_players_basic(
          - 1/2 of gap if win vs higher opp on ladder
          - +1 for playing new opponent
     """
-    result_period = period_of_date(result.match_date(), config)
-    a_played = result_period in a.match_periods and a.match_periods[result_period] > 0
-    b_played = result_period in b.match_periods and b.match_periods[result_period] > 0
+    player_name = result.player_name
+    opponent_name = result.opponent_name
+    result_period = period_of_date(result.match_date, config)
+    period_bit = 1 << result_period
+    a_played = a.played_periods & period_bit
+    b_played = b.played_periods & period_bit
 
     a_addtl_lp = 0
     b_addtl_lp = 0
     a.games_played += 1
     b.games_played += 1
-    a.total_vp += result.player_vp()
-    b.total_vp += result.opponent_vp()
-    if result.player_won():
+    a.total_vp += result.player_vp
+    b.total_vp += result.opponent_vp
+    if result.player_won:
         a.games_won += 1
         # Play + win
         if b.ladder_points > a.ladder_points:
             gap = b.ladder_points - a.ladder_points
-            a_addtl_lp += math.ceil(gap / 2)
+            a_addtl_lp += (gap + 1) // 2
         a_addtl_lp += 2
         # Play
         b_addtl_lp += 1
-    elif result.was_draw():
+    elif result.was_draw:
         a.games_drawn += 1
         b.games_drawn += 1
         # Play
@@ -154,35 +131,61 @@ def update_players_basic(
         # Play + win
         if a.ladder_points > b.ladder_points:
             gap = a.ladder_points - b.ladder_points
-            b_addtl_lp += math.ceil(gap / 2)
+            b_addtl_lp += (gap + 1) // 2
         b_addtl_lp += 2
         # Play
         a_addtl_lp += 1
     # New matchup
-    if result.opponent_name() not in a.opponents_played:
-        a.opponents_played.append(result.opponent_name())
-        b.opponents_played.append(result.player_name())
+    if opponent_name not in a.opponents_played:
+        a.opponents_played.add(opponent_name)
+        b.opponents_played.add(player_name)
         a.ladder_points += 1
         b.ladder_points += 1
     if not a_played:
         a.ladder_points += a_addtl_lp
-        a.match_periods[result_period] = 0
+        a.played_periods |= period_bit
     if not b_played:
         b.ladder_points += b_addtl_lp
-        b.match_periods[result_period] = 0
-    a.match_periods[result_period] += 1
-    b.match_periods[result_period] += 1
+        b.played_periods |= period_bit
+
+
+def apply_result(
+    player_map: dict[str, LadderPlayer],
+    result: LadderResult,
+    config: LadderConfig,
+    updater: Callable[[LadderPlayer, LadderPlayer, LadderResult, LadderConfig], None],
+) -> None:
+    """Applies a single result to a map of players, adding any players
+    that haven't been seen yet.
+
+    Args:
+        player_map (dict[str, LadderPlayer]): The players by name, updated in place
+        result (LadderResult): The result to apply
+        config (LadderConfig): The configuration of the league
+        updater (Callable[[LadderPlayer, LadderPlayer, LadderResult, LadderConfig], None]): The update logic used to compute standings
+    """
+    player_name = result.player_name
+    player = player_map.get(player_name)
+    if player is None:
+        player = player_map[player_name] = LadderPlayer(player_name, INITIAL_POINTS)
+    opponent_name = result.opponent_name
+    opponent = player_map.get(opponent_name)
+    if opponent is None:
+        opponent = player_map[opponent_name] = LadderPlayer(
+            opponent_name, INITIAL_POINTS
+        )
+    updater(player, opponent, result, config)
 
 
 def compute_standings(
-    results: Sequence[LadderResult],
+    results: Iterable[LadderResult],
     config: LadderConfig,
     updater: Callable[[LadderPlayer, LadderPlayer, LadderResult, LadderConfig], None],
 ) -> list[LadderPlayer]:
     """Computes the current standings for a ladder league.
 
     Args:
-        results (Sequence[LadderResult]): The list of results that compose the league
+        results (Iterable[LadderResult]): The results that compose the league, in match order
         config (LadderConfig): The configuration of the league
         updater (Callable[[LadderPlayer, LadderPlayer, LadderResult, LadderConfig], None]): The update logic used to compute standings
 
@@ -191,18 +194,5 @@ def compute_standings(
     """
     player_map: dict[str, LadderPlayer] = {}
     for result in results:
-        if result.player_name() not in player_map:
-            player_map[result.player_name()] = LadderPlayer(
-                result.player_name(), INITIAL_POINTS
-            )
-        if result.opponent_name() not in player_map:
-            player_map[result.opponent_name()] = LadderPlayer(
-                result.opponent_name(), INITIAL_POINTS
-            )
-        updater(
-            player_map[result.player_name()],
-            player_map[result.opponent_name()],
-            result,
-            config,
-        )
+        apply_result(player_map, result, config, updater)
     return list(player_map.values())
@@ -3,11 +3,13 @@ Holds classes that tie together the discord bot and the abstract ladder
 compute logic.
 """
 
+import asyncio
 import discord
 from ladder.ladder import (
     LadderResult,
     LadderConfig,
     LadderPlayer,
+    apply_result,
     compute_standings,
     update_players_basic,
 )
@@ -20,12 +22,18 @@ import pathlib
 from loguru import logger
 from enum import IntEnum
 import json
+from typing import Iterator, TextIO
 
+UTC = ZoneInfo("UTC")
+# Result files are read front to back in one go, so a large buffer
+# keeps the number of read syscalls low on long leagues
+RESULT_READ_BUFFER = 1 << 20
 
-class DiscordLadderResult(BaseModel, LadderResult):
+
+class DiscordLadderResult(BaseModel):
     """
-    An implementation of LadderResult that fits the responses received
-    from discord form submissions.
+    A ladder result that fits the responses received from discord
+    form submissions, and the format results are stored in.
     """
 
     model_config = ConfigDict(populate_by_name=True)
@@ -39,26 +47,21 @@ class DiscordLadderResult(BaseModel, LadderResult):
     vp_opponent: int = Field(validation_alias="opponent_vp")
     league_name: str = Field(validation_alias="league_name")
 
-    def player_name(self) -> str:
-        return self.player
-
-    def opponent_name(self) -> str:
-        return self.opponent
-
-    def player_won(self) -> bool:
-        return self.player_victory
-
-    def was_draw(self) -> bool:
-        return self.draw
-
-    def player_vp(self) -> int:
-        return self.vp_player
-
-    def opponent_vp(self) -> int:
-        return self.vp_opponent
+    def to_ladder_result(self) -> LadderResult:
+        """Converts to the result type used by the ladder compute logic.
 
-    def match_date(self) -> datetime.datetime:
-        return datetime.datetime.fromtimestamp(self.time, tz=ZoneInfo("UTC"))
+        Returns:
+            LadderResult: The same result with the match time as a datetime
+        """
+        return LadderResult(
+            player_name=self.player,
+            opponent_name=self.opponent,
+            player_won=self.player_victory,
+            player_vp=self.vp_player,
+            opponent_vp=self.vp_opponent,
+            was_draw=self.draw,
+            match_date=datetime.datetime.fromtimestamp(self.time, tz=UTC),
+        )
 
 
 class IsoWeekday(IntEnum):
@@ -91,6 +94,11 @@ class LadderManager:
     config_file: pathlib.Path
     posting_day: IsoWeekday
     posting_enabled: bool
+    _players: dict[str, LadderPlayer] | None
+    _players_key: tuple[int, int] | None
+    _standings_cache: list[LadderPlayer] | None
+    _result_file: TextIO
+    _message_weeks: set[int] | None
 
     def __init__(
         self,
@@ -103,7 +111,9 @@ class LadderManager:
         posting_day: IsoWeekday,
         posting_enabled: bool,
     ):
-        """Initializes the class and ensures parent directories are created.
+        """Initializes the class, ensures parent directories are created
+        and opens the result file for appending. Results stored as CSV by
+        earlier versions are migrated to JSON Lines the first time.
 
         Args:
             client (discord.Client): The discord bot client instance for sending messages
@@ -120,59 +130,151 @@ class LadderManager:
         self.league_name = league_name
         sanitized_name = league_name.lower().replace(" ", "-")
         self.config_file = pathlib.Path(
-            config_dir, f"{sanitized_name}-message-record.json"
+            config_dir, f"{sanitized_name}-message-record.log"
         )
-        self.results_path = pathlib.Path(results_dir, f"{sanitized_name}-results.csv")
+        self.results_path = pathlib.Path(results_dir, f"{sanitized_name}-results.jsonl")
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         self.results_path.parent.mkdir(parents=True, exist_ok=True)
         self.posting_day = posting_day
         self.posting_enabled = posting_enabled
+        self._players = None
+        self._players_key = None
+        self._standings_cache = None
+        self._message_weeks = None
+        legacy_path = self.results_path.with_suffix(".csv")
+        if legacy_path.exists() and not self.results_path.exists():
+            self._migrate_csv_results(legacy_path)
+        self._result_file = open(self.results_path, "a")
+
+    def _migrate_csv_results(self, csv_path: pathlib.Path) -> None:
+        """Rewrites a CSV result file as JSON Lines at the results path.
+        The CSV file is left in place as a backup.
 
-    def _read_results(self) -> list[LadderResult]:
-        """
-        Reads the result file, creating a new one if
-        it does not yet exist.
-        """
-        results: list[LadderResult] = []
-        if not self.results_path.exists():
-            with open(self.results_path, "w", newline="") as result_file:
-                result_writer = csv.DictWriter(
-                    result_file, DiscordLadderResult.model_fields
-                )
-                result_writer.writeheader()
-        with open(self.results_path, newline="") as csvfile:
-            result_reader = csv.DictReader(csvfile)
-            for row in result_reader:
+        Args:
+            csv_path (pathlib.Path): The CSV result file to migrate
+        """
+        tmp_path = self.results_path.with_suffix(".jsonl.tmp")
+        with (
+            open(csv_path, newline="") as csv_file,
+            open(tmp_path, "w") as jsonl_file,
+        ):
+            for row in csv.DictReader(csv_file):
                 result = DiscordLadderResult.model_validate(row)
-                results.append(result)
-        return results
+                jsonl_file.write(result.model_dump_json() + "\n")
+        os.replace(tmp_path, self.results_path)
+        logger.info("Migrated {} to {}", csv_path, self.results_path)
 
-    def _compute_standings(self) -> list[LadderPlayer]:
+    def close(self) -> None:
         """
-        Passes the results to the ladder libraries compute function
-        and returns the standings.
+        Closes the result file. The manager can't store results
+        after this is called.
         """
-        results = self._read_results()
-        standings = compute_standings(results, self.config, update_players_basic)
-        return standings
+        self._result_file.close()
+
+    def _iter_results(self) -> Iterator[LadderResult]:
+        """
+        Streams results from the result file in the
+        order they were stored.
+        """
+        with open(self.results_path, "rb", buffering=RESULT_READ_BUFFER) as file:
+            for line in file:
+                if line.isspace():
+                    continue
+                result = DiscordLadderResult.model_validate_json(line)
+                yield result.to_ladder_result()
+
+    def _load_players(self) -> tuple[tuple[int, int], dict[str, LadderPlayer]]:
+        """
+        Passes the results to the ladder libraries compute function.
+        Returns the players by name along with the size and mtime of
+        the result file they were computed from. Doesn't modify the
+        manager, so it can run in a worker thread. If the file is
+        removed while it is read, there are no players, and the key
+        won't match the file once it is recreated.
+        """
+        try:
+            stat = self.results_path.stat()
+            standings = compute_standings(
+                self._iter_results(), self.config, update_players_basic
+            )
+        except FileNotFoundError:
+            return (-1, -1), {}
+        players = {player.name: player for player in standings}
+        return (stat.st_size, stat.st_mtime_ns), players
+
+    async def _compute_standings(self) -> list[LadderPlayer]:
+        """
+        Returns the standings, sorted by ladder points. Players are
+        kept in memory and updated by store_result. They are only
+        computed from the result file again, in a worker thread, if
+        the file was changed some other way.
+        """
+        stat = self._reopen_if_replaced()
+        if self._players is None or self._players_key != (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            self._players_key, self._players = await asyncio.to_thread(
+                self._load_players
+            )
+            self._standings_cache = None
+        if self._standings_cache is None:
+            self._standings_cache = sorted(
+                self._players.values(),
+                key=lambda player: player.ladder_points,
+                reverse=True,
+            )
+        return self._standings_cache
+
+    def _reopen_if_replaced(self) -> os.stat_result:
+        """Reopens the results file if it was replaced or removed
+        since it was opened, e.g. by an editor saving a hand edit or
+        by deleting it to reset the league. A removed file is created
+        again, empty. Reopening drops the in-memory players, so they
+        are computed from the file as it is now.
+
+        Returns:
+            os.stat_result: The stat of the open results file
+        """
+        stat = os.fstat(self._result_file.fileno())
+        try:
+            current = os.stat(self.results_path)
+        except FileNotFoundError:
+            current = None
+        if current is None or (current.st_ino, current.st_dev) != (
+            stat.st_ino,
+            stat.st_dev,
+        ):
+            self._result_file.close()
+            self._result_file = open(self.results_path, "a")
+            stat = os.fstat(self._result_file.fileno())
+            self._players = None
+        return stat
 
     def store_result(self, result: DiscordLadderResult) -> None:
-        """Stores a single result on disk.
+        """Stores a single result on disk and applies it to the
+        in-memory players. The row is flushed immediately so it
+        survives a crash. If the results file was replaced since it
+        was opened, it is reopened so the row lands in the current file.
 
         Args:
             result (DiscordLadderResult): result to write
         """
-        mode = "a"
-        if not os.path.exists(self.results_path):
-            mode = "w"
-            pathlib.Path(self.results_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(self.results_path, mode, newline="") as result_file:
-            result_writer = csv.DictWriter(
-                result_file, DiscordLadderResult.model_fields
-            )
-            if mode == "w":
-                result_writer.writeheader()
-            result_writer.writerow(result.model_dump())
+        before = self._reopen_if_replaced()
+        self._result_file.write(result.model_dump_json() + "\n")
+        self._result_file.flush()
+        if self._players is None:
+            return
+        self._standings_cache = None
+        if self._players_key != (before.st_size, before.st_mtime_ns):
+            # The players don't match the file, so compute them again
+            self._players = None
+            return
+        apply_result(
+            self._players, result.to_ladder_result(), self.config, update_players_basic
+        )
+        after = os.fstat(self._result_file.fileno())
+        self._players_key = (after.st_size, after.st_mtime_ns)
 
     async def post_standings(self):
         """
@@ -182,46 +284,73 @@ class LadderManager:
         if not self.posting_enabled:
             return
         # is today after 5PM UTC (12 EST) on the weekday for posting messages, and before the end of
-        # the league?
-        now = datetime.datetime.now(tz=ZoneInfo("UTC"))
-        valid_date = now <= self.config.end_date and now >= self.config.start_date
-        valid_day = now.date().isoweekday() >= self.posting_day
-        valid_time = now.hour >= 16
-        if not (valid_day and valid_time and valid_date):
+        # the league? Cheapest and most often failing checks go first.
+        now = datetime.datetime.now(tz=UTC)
+        if now.hour < 16 or now.isoweekday() < self.posting_day:
+            return
+        if not (self.config.start_date <= now <= self.config.end_date):
             return
         # is a record of this week's message present?
-        need_to_post = True
-        message_record = []
-        if not self.config_file.exists():
-            with open(self.config_file, "w") as file:
-                json.dump(message_record, file)
-        else:
-            with open(self.config_file, "r") as file:
-                message_record = json.load(file)
-            for message in message_record:
-                if str(message) == str(now.isocalendar()[1]):
-                    need_to_post = False
+        this_week = now.isocalendar().week
+        if self._message_weeks is None:
+            self._message_weeks = await asyncio.to_thread(self._read_message_record)
+        if this_week in self._message_weeks:
+            return
         # if not, post it
-        if need_to_post:
-            await self._post_standings()
-            message_record.append(now.isocalendar()[1])
-            with open(self.config_file, "w") as file:
-                json.dump(message_record, file)
+        await self._post_standings(now)
+        self._message_weeks.add(this_week)
+        with open(self.config_file, "a") as file:
+            file.write(f"{this_week}\n")
 
-    async def _post_standings(self) -> None:
+    def _read_message_record(self) -> set[int]:
         """
-        Computes standings and sends a message.
+        Reads the weeks that standings have already been
+        posted for from the message record file, which holds
+        one week number per line. A JSON record from earlier
+        versions is migrated the first time.
         """
-        standings = self._compute_standings()
+        if not self.config_file.exists():
+            legacy_path = self.config_file.with_suffix(".json")
+            if not legacy_path.exists():
+                return set()
+            self._migrate_json_record(legacy_path)
+        with open(self.config_file, "r") as file:
+            return {int(line) for line in file if not line.isspace()}
+
+    def _migrate_json_record(self, json_path: pathlib.Path) -> None:
+        """Rewrites a JSON message record as a log at the message
+        record path. The JSON file is left in place as a backup.
+
+        Args:
+            json_path (pathlib.Path): The JSON message record to migrate
+        """
+        with open(json_path, "r") as file:
+            weeks = sorted({int(week) for week in json.load(file)})
+        tmp_path = self.config_file.with_suffix(".log.tmp")
+        with open(tmp_path, "w") as file:
+            file.writelines(f"{week}\n" for week in weeks)
+        os.replace(tmp_path, self.config_file)
+        logger.info("Migrated {} to {}", json_path, self.config_file)
+
+    async def _post_standings(self, now: datetime.datetime) -> None:
+        """Computes standings and sends a message.
+
+        Args:
+            now (datetime.datetime): The time the standings are posted as of
+        """
+        standings = await self._compute_standings()
         if len(standings) == 0:
             return
-        standings.sort(key=lambda player: player.ladder_points, reverse=True)
-        message = f"""## Ladder Standings for {self.league_name} 
-*As of {datetime.datetime.now().strftime("%B %d, %Y")}*
-        {"\n".join([f"- {player.name} ({player.ladder_points}) " for player in standings])}
-        """
+        lines = [
+            f"## Ladder Standings for {self.league_name}",
+            f"*As of {now.strftime('%B %d, %Y')}*",
+        ]
+        lines.extend(
+            f"- {player.name} ({player.ladder_points})" for player in standings
+        )
+        message = "\n".join(lines)
         channel = self.client.get_channel(self.channel_id)
-        logger.info(f"{channel}: {type(channel)}")
+        logger.info("{}: {}", channel, type(channel))
         if not (
             isinstance(channel, discord.TextChannel)
             or isinstance(channel, discord.Thread)